@@ -82,7 +82,8 @@ def main():
     # Selection for extraction engine
     extractor_choices = [
         "Auto-Select", "docling", "pdfplumber", "PyMuPDF", 
-        "easyocr", "pytesseract", "python-docx", "beautifulsoup4"
+        "easyocr", "pytesseract", "python-docx", "beautifulsoup4",
+        "docx-stream", "html-stream"
     ]
     selected_extractor = st.selectbox("Extraction Mode", extractor_choices, index=0)
     
@@ -226,11 +227,16 @@ def main():
                 status_icon = "❌ Error" if debug_info.get("score", -1) < 0 else "⚠️ Rejected"
                 score_display = f"{debug_info['score']:.2f}" if debug_info.get("score", -1) >= 0 else "Failed"
                 err_msg = f"<br><i>Reason: {debug_info['error']}</i>" if "error" in debug_info else ""
+                page_msg = ""
+                if "pages" in debug_info:
+                    page_msg = (f"<br><b>Pages:</b> {debug_info['pages']} "
+                                f"| <b>Blank skipped:</b> {debug_info['skipped_blank_pages']} "
+                                f"| <b>Duplicates skipped:</b> {debug_info['skipped_duplicate_pages']}")
                 
                 st.markdown(f"""
                 <div class="debug-card">
                     <b>Engine:</b> {debug_info['source']} <span style="float:right;">{status_icon}</span><br>
-                    <b>Score:</b> {score_display} {err_msg}
+                    <b>Score:</b> {score_display} {err_msg}{page_msg}
                 </div>
                 """, unsafe_allow_html=True)
 
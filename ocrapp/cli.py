@@ -41,7 +41,16 @@ def main():
             print("DEBUG REPORT (All Extractor Scores):")
             for debug_info in result.get("debug", []):
                 err = f" (Error: {debug_info['error']})" if "error" in debug_info else ""
-                print(f" - {debug_info['source']}: {debug_info['score']}{err}")
+                skipped = ""
+                if "pages" in debug_info:
+                    skipped = (f" [pages: {debug_info['pages']}, blank skipped: {debug_info['skipped_blank_pages']}, "
+                               f"duplicates skipped: {debug_info['skipped_duplicate_pages']}]")
+                print(f" - {debug_info['source']}: {debug_info['score']}{skipped}{err}")
+            sched = result.get("scheduler")
+            if sched:
+                print(f"SCHEDULER: queue depth {sched['queue_depth']} (max {sched['max_queue_depth']}), "
+                      f"admissions waited {sched['admissions_waited']}/{sched['admitted']}, "
+                      f"max wait {sched['max_wait_s']:.2f}s")
             print("="*50 + "\n")
             
     except Exception as e:
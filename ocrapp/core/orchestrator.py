@@ -1,22 +1,33 @@
 import os
 import mimetypes
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from ocrapp.scoring.scorer import TextScorer
+from ocrapp.core.scheduler import ResourceGovernor, get_default_governor
+from ocrapp.utils import count_pages, PageFilter
 from ocrapp.extractors.pdf_extractors import DoclingExtractor, PdfPlumberExtractor, PyMuPDFExtractor
-from ocrapp.extractors.ocr_extractors import PytesseractExtractor, EasyOCRExtractor
-from ocrapp.extractors.doc_extractors import DocxExtractor, HtmlExtractor
+from ocrapp.extractors.ocr_extractors import BaseOCRExtractor, PytesseractExtractor, EasyOCRExtractor
+from ocrapp.extractors.doc_extractors import (
+    DocxExtractor, HtmlExtractor, StreamingDocxExtractor, StreamingHtmlExtractor
+)
 
 logger = logging.getLogger(__name__)
 
+# Above this size DOCX/HTML files are only handed to the streaming extractors,
+# since building the full document object model gets slow and memory-heavy.
+LARGE_DOCUMENT_BYTES = 10 * 1024 * 1024
+
 class DocumentExtractor:
     """
     Main orchestrator that selects appropriate extractors based on file type,
     executes them, scores the results, and returns the best extraction.
+    Every extractor call is admitted through a ResourceGovernor (shared
+    process-wide by default) so concurrent jobs do not oversubscribe CPU/memory.
     """
-    def __init__(self):
+    def __init__(self, governor: Optional[ResourceGovernor] = None):
         self.scorer = TextScorer()
+        self.governor = governor if governor is not None else get_default_governor()
         
         # Initialize extractors
         logger.info("Initializing extractors...")
@@ -29,6 +40,8 @@ class DocumentExtractor:
         
         self.docx = DocxExtractor()
         self.html = HtmlExtractor()
+        self.docx_stream = StreamingDocxExtractor()
+        self.html_stream = StreamingHtmlExtractor()
         logger.info("Extractors initialized successfully.")
 
     def _get_extractors_for_file(self, file_path: str) -> List[Any]:
@@ -36,6 +49,7 @@ class DocumentExtractor:
         mime, _ = mimetypes.guess_type(file_path)
         
         extractors = []
+        is_large = os.path.getsize(file_path) > LARGE_DOCUMENT_BYTES
         
         if ext == '.pdf' or mime == 'application/pdf':
             # Try PDF-specific first
@@ -48,16 +62,20 @@ class DocumentExtractor:
             extractors.extend([self.pytesseract, self.easyocr])
             
         elif ext == '.docx' or mime == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-            extractors.append(self.docx)
+            extractors.extend([self.docx_stream] if is_large else [self.docx, self.docx_stream])
             
         elif ext in ['.html', '.htm'] or mime == 'text/html':
-            extractors.append(self.html)
+            extractors.extend([self.html_stream] if is_large else [self.html, self.html_stream])
         
         return extractors
 
-    def process(self, file_path: str, extractor_name: str = "Auto-Select") -> Dict[str, Any]:
+    def process(self, file_path: str, extractor_name: str = "Auto-Select",
+                page_filter: Optional[PageFilter] = None) -> Dict[str, Any]:
         """
         Process a file and return the best extraction result, or the explicitly requested one.
+        OCR duplicate-page reuse is scoped to this document unless a page_filter
+        is passed; share one PageFilter across the process() calls of a batch
+        to also reuse text between its documents.
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -65,7 +83,8 @@ class DocumentExtractor:
         all_extractors = [
             self.docling, self.pdfplumber, self.pymupdf,
             self.pytesseract, self.easyocr,
-            self.docx, self.html
+            self.docx, self.html,
+            self.docx_stream, self.html_stream
         ]
             
         if extractor_name and extractor_name != "Auto-Select":
@@ -78,27 +97,50 @@ class DocumentExtractor:
             extractors = self._get_extractors_for_file(file_path)
         
         results = []
+        if page_filter is None:
+            page_filter = PageFilter()
+        try:
+            pages = count_pages(file_path)
+        except Exception as e:
+            logger.warning(f"Could not count pages, assuming 1: {str(e)}")
+            pages = 1
         
         for extractor in extractors:
             logger.info(f"Attempting extraction with [{extractor.name}]...")
+            extractor.stats = {}
+            grant = None
+            if isinstance(extractor, BaseOCRExtractor):
+                extractor.page_filter = page_filter
             try:
-                text = extractor.extract(file_path)
+                with self.governor.admit(extractor.name, pages) as grant:
+                    extractor.configure_threads(grant.threads)
+                    text = extractor.extract(file_path)
                 score = self.scorer.score(text)
                 results.append({
                     "source": extractor.name,
                     "score": score,
-                    "text": text
+                    "text": text,
+                    "threads": grant.threads,
+                    "admission_wait_s": grant.wait_s,
+                    # Per-engine diagnostics such as skipped blank/duplicate page counts
+                    **extractor.stats
                 })
                 logger.info(f"[{extractor.name}] Score: {score:.2f}")
             except Exception as e:
                 logger.error(f"[{extractor.name}] Failed: {str(e)}")
                 # We do not discard failed extractors silently but rather log them and skip scoring.
-                results.append({
+                failed = {
                     "source": extractor.name,
                     "score": -1.0,
                     "text": "",
                     "error": str(e)
-                })
+                }
+                if grant is not None:
+                    failed["admission_wait_s"] = grant.wait_s
+                results.append(failed)
+            finally:
+                if isinstance(extractor, BaseOCRExtractor):
+                    extractor.page_filter = None
                 
         # Filter successful ones
         valid_results = [r for r in results if r["score"] >= 0]
@@ -109,6 +151,7 @@ class DocumentExtractor:
                 "score": 0.0,
                 "text": "",
                 "debug": results,
+                "scheduler": self.governor.metrics(),
                 "error": "All extractors failed."
             }
             
@@ -119,5 +162,6 @@ class DocumentExtractor:
             "source": best_result["source"],
             "score": best_result["score"],
             "text": best_result["text"],
-            "debug": results
+            "debug": results,
+            "scheduler": self.governor.metrics()
         }
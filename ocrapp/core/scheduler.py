@@ -0,0 +1,177 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class EngineCost:
+    """
+    Rough resource footprint of one extractor invocation: the CPU threads it
+    should be allowed and its expected resident memory (MB) as a fixed part
+    plus a per-page part.
+    """
+    threads: int
+    base_rss_mb: float
+    rss_per_page_mb: float
+
+    def rss_mb(self, pages: int) -> float:
+        return self.base_rss_mb + self.rss_per_page_mb * max(pages, 1)
+
+# Model weights for easyocr/docling are loaded once at startup, so the base
+# figures only cover per-call working memory (tensors, rendered pages).
+DEFAULT_ENGINE_COSTS: Dict[str, EngineCost] = {
+    "docling": EngineCost(threads=4, base_rss_mb=800, rss_per_page_mb=120),
+    "easyocr": EngineCost(threads=4, base_rss_mb=300, rss_per_page_mb=150),
+    "pytesseract": EngineCost(threads=1, base_rss_mb=100, rss_per_page_mb=60),
+    "PyMuPDF": EngineCost(threads=1, base_rss_mb=30, rss_per_page_mb=2),
+    "pdfplumber": EngineCost(threads=1, base_rss_mb=50, rss_per_page_mb=15),
+    "python-docx": EngineCost(threads=1, base_rss_mb=200, rss_per_page_mb=0),
+    "beautifulsoup4": EngineCost(threads=1, base_rss_mb=200, rss_per_page_mb=0),
+    "docx-stream": EngineCost(threads=1, base_rss_mb=20, rss_per_page_mb=0),
+    "html-stream": EngineCost(threads=1, base_rss_mb=20, rss_per_page_mb=0),
+}
+FALLBACK_ENGINE_COST = EngineCost(threads=1, base_rss_mb=200, rss_per_page_mb=50)
+
+def _physical_memory_mb() -> Optional[float]:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+@dataclass(frozen=True)
+class Grant:
+    """Resources reserved for one admitted extractor invocation."""
+    engine: str
+    threads: int
+    memory_mb: float
+    wait_s: float
+
+class ResourceGovernor:
+    """
+    Admission control for extractor invocations across all concurrent jobs.
+    Each call is costed with its EngineCost and admitted only once its threads
+    and expected memory fit in the remaining CPU/memory budget; otherwise it
+    waits in a FIFO queue. A call that exceeds the budget on its own is still
+    admitted when nothing else is running, so it cannot deadlock.
+    """
+    def __init__(self, cpu_budget: Optional[int] = None, memory_budget_mb: Optional[float] = None,
+                 engine_costs: Optional[Dict[str, EngineCost]] = None):
+        self.cpu_budget = max(int(cpu_budget or os.cpu_count() or 1), 1)
+        if memory_budget_mb is None:
+            physical = _physical_memory_mb()
+            memory_budget_mb = physical * 0.75 if physical else 4096.0
+        self.memory_budget_mb = float(memory_budget_mb)
+        self.engine_costs = dict(DEFAULT_ENGINE_COSTS)
+        if engine_costs:
+            self.engine_costs.update(engine_costs)
+
+        self._cond = threading.Condition()
+        self._queue: deque = deque()
+        self._running = 0
+        self._threads_in_use = 0
+        self._memory_in_use_mb = 0.0
+        self._admitted = 0
+        self._waited = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+        self._max_queue_depth = 0
+
+    def cost_for(self, engine: str) -> EngineCost:
+        return self.engine_costs.get(engine, FALLBACK_ENGINE_COST)
+
+    def _fits(self, threads: int, memory_mb: float) -> bool:
+        if self._running == 0:
+            return True
+        return (self._threads_in_use + threads <= self.cpu_budget
+                and self._memory_in_use_mb + memory_mb <= self.memory_budget_mb)
+
+    @contextmanager
+    def admit(self, engine: str, pages: int = 1) -> Iterator[Grant]:
+        """
+        Blocks until the invocation fits the budget, then yields its Grant and
+        releases the reservation on exit.
+        """
+        cost = self.cost_for(engine)
+        threads = min(max(cost.threads, 1), self.cpu_budget)
+        memory_mb = min(cost.rss_mb(pages), self.memory_budget_mb)
+
+        ticket = object()
+        start = time.monotonic()
+        with self._cond:
+            self._queue.append(ticket)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            try:
+                while self._queue[0] is not ticket or not self._fits(threads, memory_mb):
+                    self._cond.wait()
+            except BaseException:
+                # Never leave a dead ticket at the head of the queue
+                self._queue.remove(ticket)
+                self._cond.notify_all()
+                raise
+            self._queue.popleft()
+            wait_s = time.monotonic() - start
+            self._running += 1
+            self._threads_in_use += threads
+            self._memory_in_use_mb += memory_mb
+            self._admitted += 1
+            if wait_s > 0.001:
+                self._waited += 1
+            self._total_wait_s += wait_s
+            self._max_wait_s = max(self._max_wait_s, wait_s)
+            # The next queued call may fit alongside this one
+            self._cond.notify_all()
+
+        if wait_s > 0.001:
+            logger.info(f"[{engine}] Admitted after waiting {wait_s:.2f}s "
+                        f"({threads} threads, ~{memory_mb:.0f} MB)")
+        try:
+            yield Grant(engine=engine, threads=threads, memory_mb=memory_mb, wait_s=wait_s)
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._threads_in_use -= threads
+                self._memory_in_use_mb -= memory_mb
+                self._cond.notify_all()
+
+    def metrics(self) -> Dict[str, float]:
+        """Snapshot of current load, queue depth and admission wait statistics."""
+        with self._cond:
+            return {
+                "cpu_budget": self.cpu_budget,
+                "memory_budget_mb": self.memory_budget_mb,
+                "running": self._running,
+                "threads_in_use": self._threads_in_use,
+                "memory_in_use_mb": self._memory_in_use_mb,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_queue_depth,
+                "admitted": self._admitted,
+                "admissions_waited": self._waited,
+                "total_wait_s": self._total_wait_s,
+                "max_wait_s": self._max_wait_s,
+                "avg_wait_s": self._total_wait_s / self._admitted if self._admitted else 0.0,
+            }
+
+_default_governor: Optional[ResourceGovernor] = None
+_default_lock = threading.Lock()
+
+def get_default_governor() -> ResourceGovernor:
+    """
+    Process-wide governor shared by every DocumentExtractor that is not given
+    its own. Budgets can be set with OCRAPP_CPU_BUDGET and OCRAPP_MEMORY_BUDGET_MB.
+    """
+    global _default_governor
+    with _default_lock:
+        if _default_governor is None:
+            cpu = os.environ.get("OCRAPP_CPU_BUDGET")
+            memory = os.environ.get("OCRAPP_MEMORY_BUDGET_MB")
+            _default_governor = ResourceGovernor(
+                cpu_budget=int(cpu) if cpu else None,
+                memory_budget_mb=float(memory) if memory else None,
+            )
+        return _default_governor
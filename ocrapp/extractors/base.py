@@ -1,5 +1,6 @@
 import abc
 import logging
+import threading
 
 class BaseExtractor(abc.ABC):
     """
@@ -8,12 +9,33 @@ class BaseExtractor(abc.ABC):
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._local = threading.local()
         
     @property
     @abc.abstractmethod
     def name(self) -> str:
         """Name of the extractor."""
         pass
+
+    @property
+    def stats(self) -> dict:
+        """
+        Diagnostics from the most recent extract() call on the current thread
+        (e.g. skipped page counts). Empty for extractors that report none.
+        """
+        return getattr(self._local, "stats", {})
+
+    @stats.setter
+    def stats(self, value: dict):
+        self._local.stats = value
+
+    def configure_threads(self, threads: int) -> None:
+        """
+        Called by the orchestrator before each extract() with the CPU thread
+        count granted by the resource governor. Single-threaded extractors
+        ignore it.
+        """
+        pass
         
     @abc.abstractmethod
     def extract(self, file_path: str) -> str:
@@ -1,3 +1,10 @@
+import codecs
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import List, Tuple
+
 import docx
 from bs4 import BeautifulSoup
 from ocrapp.extractors.base import BaseExtractor
@@ -17,6 +24,217 @@ class HtmlExtractor(BaseExtractor):
         return "beautifulsoup4"
         
     def extract(self, file_path: str) -> str:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # Pass raw bytes so BeautifulSoup can detect the document encoding itself
+        with open(file_path, 'rb') as f:
             soup = BeautifulSoup(f, "html.parser")
             return soup.get_text(separator='\n', strip=True)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_SKIP_SUBTREES = {
+    "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback",
+    _W + "pPr",
+}
+
+_RUN_BREAKS = {_W + "tab": "\t", _W + "br": "\n", _W + "cr": "\n"}
+
+def _part_number(name: str) -> int:
+    digits = re.search(r"(\d*)\.xml$", name).group(1)
+    return int(digits) if digits else 0
+
+class StreamingDocxExtractor(BaseExtractor):
+    """
+    Reads the WordprocessingML parts straight from the DOCX zip with iterparse,
+    so memory stays flat regardless of document size. Covers body paragraphs,
+    tables (one line per row, cells separated by tabs), headers and footers.
+    """
+    @property
+    def name(self) -> str:
+        return "docx-stream"
+
+    def extract(self, file_path: str) -> str:
+        lines: List[str] = []
+        with zipfile.ZipFile(file_path) as zf:
+            names = zf.namelist()
+            headers = sorted((n for n in names if re.fullmatch(r"word/header\d*\.xml", n)), key=_part_number)
+            footers = sorted((n for n in names if re.fullmatch(r"word/footer\d*\.xml", n)), key=_part_number)
+            for part in headers + ["word/document.xml"] + footers:
+                with zf.open(part) as f:
+                    self._parse_part(f, lines)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _parse_part(f, lines: List[str]) -> None:
+        runs: List[List[str]] = []    # run text of each open paragraph (text boxes nest them)
+        cells: List[List[str]] = []   # paragraphs of each open table cell (innermost last)
+        rows: List[List[str]] = []    # cells of each open table row (innermost last)
+        open_elems = []               # ancestors of the current element, root first
+        # mc:Fallback duplicates mc:Choice content; w:pPr holds tab-stop definitions (w:tabs/w:tab)
+        skip_depth = 0
+
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                open_elems.append(elem)
+                if tag in _SKIP_SUBTREES:
+                    skip_depth += 1
+                elif skip_depth:
+                    pass
+                elif tag == _W + "p":
+                    runs.append([])
+                elif tag == _W + "tc":
+                    cells.append([])
+                elif tag == _W + "tr":
+                    rows.append([])
+                continue
+
+            open_elems.pop()
+            if tag in _SKIP_SUBTREES:
+                skip_depth -= 1
+            elif skip_depth:
+                pass
+            elif tag == _W + "p":
+                text = "".join(runs.pop())
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    lines.append(text)
+            elif tag == _W + "t":
+                if runs:
+                    runs[-1].append(elem.text or "")
+            elif tag in _RUN_BREAKS:
+                if runs:
+                    runs[-1].append(_RUN_BREAKS[tag])
+            elif tag == _W + "tc":
+                cell = " ".join(p for p in cells.pop() if p)
+                if rows:
+                    rows[-1].append(cell)
+            elif tag == _W + "tr":
+                row = "\t".join(rows.pop())
+                if cells:
+                    # Nested table: the row belongs to the enclosing cell
+                    cells[-1].append(row)
+                else:
+                    lines.append(row)
+
+            # Detach every finished element from its parent so the partial tree
+            # only ever holds the open ancestors (plus siblings the parser has
+            # buffered ahead), whatever the size of a single table or section.
+            elem.clear()
+            if open_elems:
+                parent = open_elems[-1]
+                if len(parent) and parent[0] is elem:
+                    del parent[0]
+
+class _TextCollector(HTMLParser):
+    """
+    Incremental HTMLParser that keeps visible text nodes, one per line.
+    A text node can reach handle_data in several pieces when it spans feed()
+    chunks, so pieces are buffered and only flushed at markup boundaries.
+    """
+    _SKIP_TAGS = {"script", "style", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: List[str] = []
+        self._skip_depth = 0
+        self._pending: List[str] = []
+
+    def _flush(self):
+        data = "".join(self._pending).strip()
+        self._pending = []
+        if data:
+            self.lines.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._pending.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:\-]+)""", re.IGNORECASE)
+_XML_ENCODING = re.compile(rb"""^<\?xml[^>]+encoding\s*=\s*["']([A-Za-z0-9_.:\-]+)""")
+
+def _sniff_html_encoding(head: bytes) -> Tuple[str, bool]:
+    """
+    Picks a decoder for an HTML byte stream from its first chunk:
+    BOM, then <meta charset> / XML declaration, then a UTF-8 validity check,
+    falling back to windows-1252 as browsers do. Returns (encoding, declared);
+    declared is False when the encoding is only a guess from the first chunk.
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig", True
+    if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+        return "utf-16", True
+
+    match = _XML_ENCODING.match(head) or _META_CHARSET.search(head)
+    if match:
+        try:
+            encoding = codecs.lookup(match.group(1).decode("ascii")).name
+            # A declared UTF-16 in an ASCII-compatible stream is a lie (HTML spec)
+            if encoding.startswith("utf-16"):
+                return "utf-8", True
+            # Browsers decode latin-1 and us-ascii labels as windows-1252
+            if encoding in ("iso8859-1", "ascii"):
+                return "cp1252", True
+            return encoding, True
+        except LookupError:
+            pass
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8", False
+    except UnicodeDecodeError:
+        return "cp1252", False
+
+class StreamingHtmlExtractor(BaseExtractor):
+    """
+    Feeds the file to an incremental HTML parser in fixed-size chunks after
+    sniffing the encoding, instead of decoding and building the whole DOM.
+    """
+    CHUNK_SIZE = 64 * 1024
+
+    @property
+    def name(self) -> str:
+        return "html-stream"
+
+    def extract(self, file_path: str) -> str:
+        parser = _TextCollector()
+        with open(file_path, 'rb') as f:
+            head = f.read(self.CHUNK_SIZE)
+            encoding, declared = _sniff_html_encoding(head)
+            # An undeclared UTF-8 guess is decoded strictly so a later
+            # non-UTF-8 byte can switch the rest of the stream to windows-1252
+            guessed_utf8 = encoding == "utf-8" and not declared
+            decoder = codecs.getincrementaldecoder(encoding)(errors="strict" if guessed_utf8 else "replace")
+
+            def decode(data: bytes, final: bool = False) -> str:
+                nonlocal decoder
+                try:
+                    return decoder.decode(data, final)
+                except UnicodeDecodeError:
+                    pending = decoder.getstate()[0]
+                    decoder = codecs.getincrementaldecoder("cp1252")(errors="replace")
+                    return decoder.decode(pending + data, final)
+
+            chunk = head
+            while chunk:
+                parser.feed(decode(chunk))
+                chunk = f.read(self.CHUNK_SIZE)
+            parser.feed(decode(b"", final=True))
+        parser.close()
+        return "\n".join(parser.lines)
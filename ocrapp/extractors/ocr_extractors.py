@@ -1,14 +1,64 @@
+import os
 import pytesseract
 import easyocr
 import numpy as np
 from PIL import Image
+from typing import Callable, List, Optional
 from ocrapp.extractors.base import BaseExtractor
-from ocrapp.utils import is_pdf, pdf_to_images
+from ocrapp.utils import is_pdf, pdf_to_images, is_blank_image, PageFilter
 
-class PytesseractExtractor(BaseExtractor):
+class BaseOCRExtractor(BaseExtractor):
+    """
+    Shared page loop for OCR engines: renders the input to page images and
+    runs the engine only on pages that are not blank and not confirmed
+    duplicates in the current PageFilter. The orchestrator assigns the filter
+    per call (thread-local); without one, duplicates are only detected within
+    the document being extracted.
+    """
+    @property
+    def page_filter(self) -> Optional[PageFilter]:
+        return getattr(self._local, "page_filter", None)
+
+    @page_filter.setter
+    def page_filter(self, value: Optional[PageFilter]):
+        self._local.page_filter = value
+
+    def _load_images(self, file_path: str) -> List[Image.Image]:
+        if is_pdf(file_path):
+            return pdf_to_images(file_path)
+        return [Image.open(file_path)]
+
+    def _ocr_pages(self, images: List[Image.Image], ocr_page: Callable[[Image.Image], str]) -> List[str]:
+        page_filter = self.page_filter if self.page_filter is not None else PageFilter()
+        stats = {"pages": len(images), "skipped_blank_pages": 0, "skipped_duplicate_pages": 0}
+        texts = []
+        for img in images:
+            if is_blank_image(img):
+                stats["skipped_blank_pages"] += 1
+                texts.append("")
+                continue
+
+            key, cached = page_filter.lookup(self.name, img)
+            if cached is not None:
+                stats["skipped_duplicate_pages"] += 1
+                texts.append(cached)
+                continue
+
+            text = ocr_page(img)
+            page_filter.store(key, text)
+            texts.append(text)
+
+        self.stats = stats
+        return texts
+
+class PytesseractExtractor(BaseOCRExtractor):
     @property
     def name(self) -> str:
         return "pytesseract"
+
+    def configure_threads(self, threads: int) -> None:
+        # Read by each tesseract subprocess to cap its OpenMP thread pool
+        os.environ["OMP_THREAD_LIMIT"] = str(threads)
         
     def extract(self, file_path: str) -> str:
         # Check if tesseract is installed
@@ -16,24 +66,15 @@ class PytesseractExtractor(BaseExtractor):
         if not shutil.which("tesseract"):
             raise FileNotFoundError("Tesseract is not installed on the system.")
             
-        images = []
-        if is_pdf(file_path):
-            images = pdf_to_images(file_path)
-        else:
-            images = [Image.open(file_path)]
-            
-        full_text = []
-        for img in images:
-            text = pytesseract.image_to_string(img)
-            full_text.append(text)
-            
+        images = self._load_images(file_path)
+        full_text = self._ocr_pages(images, pytesseract.image_to_string)
         return "\n".join(full_text)
 
 import logging
 # Suppress easyocr warning
 logging.getLogger("easyocr.easyocr").setLevel(logging.ERROR)
 
-class EasyOCRExtractor(BaseExtractor):
+class EasyOCRExtractor(BaseOCRExtractor):
     def __init__(self):
         super().__init__()
         # Initialize easyocr reader once
@@ -42,19 +83,18 @@ class EasyOCRExtractor(BaseExtractor):
     @property
     def name(self) -> str:
         return "easyocr"
+
+    def configure_threads(self, threads: int) -> None:
+        import torch
+        torch.set_num_threads(threads)
+
+    def _read_page(self, img: Image.Image) -> str:
+        # easyocr requires numpy array
+        img_np = np.array(img)
+        result = self.reader.readtext(img_np, detail=0)
+        return " ".join(result)
         
     def extract(self, file_path: str) -> str:
-        images = []
-        if is_pdf(file_path):
-            images = pdf_to_images(file_path)
-        else:
-            images = [Image.open(file_path)]
-            
-        full_text = []
-        for img in images:
-            # easyocr requires numpy array
-            img_np = np.array(img)
-            result = self.reader.readtext(img_np, detail=0)
-            full_text.append(" ".join(result))
-            
+        images = self._load_images(file_path)
+        full_text = self._ocr_pages(images, self._read_page)
         return "\n".join(full_text)
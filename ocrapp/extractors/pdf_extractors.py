@@ -38,6 +38,10 @@ class DoclingExtractor(BaseExtractor):
     @property
     def name(self) -> str:
         return "docling"
+
+    def configure_threads(self, threads: int) -> None:
+        import torch
+        torch.set_num_threads(threads)
         
     def extract(self, file_path: str) -> str:
         result = self.converter.convert(file_path)
@@ -1,7 +1,11 @@
 import fitz
-from PIL import Image
+from PIL import Image, ImageStat
 import os
+import hashlib
 import mimetypes
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 def is_pdf(file_path: str) -> bool:
     mime, _ = mimetypes.guess_type(file_path)
@@ -21,3 +25,95 @@ def pdf_to_images(pdf_path: str) -> list[Image.Image]:
             img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
             images.append(img)
     return images
+
+def count_pages(file_path: str) -> int:
+    """
+    Page count used for cost estimates. Non-PDF inputs count as one page.
+    """
+    if not is_pdf(file_path):
+        return 1
+    with fitz.open(file_path) as doc:
+        return doc.page_count
+
+def is_blank_image(img: Image.Image, ink_ratio: float = 0.00005, min_stddev: float = 1.0) -> bool:
+    """
+    Blank-page check on the grayscale page at OCR resolution (downsampling
+    blurs thin strokes until a short line of text disappears). A page is blank
+    when its pixel variance is negligible or when the share of "ink" pixels
+    (clearly lighter or darker than the dominant background tone, so
+    light-on-dark pages count too) is below `ink_ratio`. The default keeps a
+    single "Page 3" at 10 pt on A4/200 DPI (~600 ink pixels) as content while
+    a few dust specks (~60 pixels) still count as blank.
+    """
+    gray = img.convert("L")
+
+    if ImageStat.Stat(gray).stddev[0] < min_stddev:
+        return True
+
+    hist = gray.histogram()
+    total = sum(hist)
+    background = max(range(256), key=hist.__getitem__)
+    ink = sum(count for value, count in enumerate(hist) if abs(value - background) > 48)
+    return ink / total < ink_ratio
+
+def image_dhash(img: Image.Image, hash_size: int = 16) -> int:
+    """
+    Perceptual difference hash: compares horizontally adjacent pixels of a
+    (hash_size + 1) x hash_size grayscale thumbnail, giving hash_size**2 bits.
+    """
+    gray = img.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+    pixels = gray.tobytes()
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+def image_digest(img: Image.Image) -> bytes:
+    """Exact content digest of the page pixels at full (OCR) resolution."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{img.mode}:{img.size[0]}x{img.size[1]}".encode())
+    h.update(img.tobytes())
+    return h.digest()
+
+class PageFilter:
+    """
+    Duplicate-page cache for one document or one explicit batch of documents.
+    Pages are bucketed by perceptual hash, but cached OCR text is reused only
+    when the full-resolution pixels are byte-identical: a perceptual match
+    cannot tell "$100.00" from "$700.00" on an otherwise identical page.
+    Entries are namespaced per OCR engine. The cache is bounded (LRU) and
+    thread-safe; create a new PageFilter (or call clear()) for each batch.
+    """
+    def __init__(self, cache_size: int = 512):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int], List[Tuple[bytes, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, namespace: str, img: Image.Image) -> Tuple[tuple, Optional[str]]:
+        """
+        Returns (key, cached_text). cached_text is None when no identical page
+        has been seen and the page needs to be OCR'd; pass the key to store()
+        afterwards.
+        """
+        cache_key = (namespace, image_dhash(img))
+        digest = image_digest(img)
+        with self._lock:
+            for seen, text in self._cache.get(cache_key, []):
+                if seen == digest:
+                    self._cache.move_to_end(cache_key)
+                    return (cache_key, digest), text
+        return (cache_key, digest), None
+
+    def store(self, key: tuple, text: str) -> None:
+        cache_key, digest = key
+        with self._lock:
+            self._cache.setdefault(cache_key, []).append((digest, text))
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
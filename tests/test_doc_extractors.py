@@ -0,0 +1,149 @@
+import codecs
+import os
+import tracemalloc
+import zipfile
+
+import pytest
+
+pytest.importorskip("docx")
+pytest.importorskip("bs4")
+
+from ocrapp.extractors.doc_extractors import (
+    HtmlExtractor, StreamingDocxExtractor, StreamingHtmlExtractor, _sniff_html_encoding
+)
+
+TESTS_DIR = os.path.dirname(__file__)
+
+NS = ('xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+      'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"')
+
+def para(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+def cell(*paragraphs):
+    return "<w:tc>" + "".join(paragraphs) + "</w:tc>"
+
+def table(*rows):
+    return "<w:tbl>" + "".join("<w:tr>" + "".join(r) + "</w:tr>" for r in rows) + "</w:tbl>"
+
+def write_docx(path, body, parts=None):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("word/document.xml", f"<w:document {NS}><w:body>{body}</w:body></w:document>")
+        for name, xml in (parts or {}).items():
+            zf.writestr(name, xml)
+    return str(path)
+
+def docx_text(tmp_path, body, parts=None):
+    return StreamingDocxExtractor().extract(write_docx(tmp_path / "doc.docx", body, parts))
+
+# --- DOCX ---
+
+def test_docx_matches_python_docx_on_sample():
+    path = os.path.join(TESTS_DIR, "test_doc.docx")
+    assert StreamingDocxExtractor().extract(path).strip() == \
+        "This is a simple DOCX file for testing the python-docx extractor."
+
+def test_docx_tables_one_row_per_line(tmp_path):
+    body = para("Intro") + table(
+        [cell(para("A1"), para("more")), cell(para("B1"))],
+        [cell(table([cell(para("n1")), cell(para("n2"))])), cell(para("B2"))],
+    )
+    assert docx_text(tmp_path, body).split("\n") == ["Intro", "A1 more\tB1", "n1\tn2\tB2"]
+
+def test_docx_skips_fallback_and_tab_stop_definitions(tmp_path):
+    tab_stops = ('<w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/>'
+                 '<w:tab w:val="left" w:pos="1440"/></w:tabs></w:pPr>')
+    body = (f"<w:p>{tab_stops}<w:r><w:t>Hello</w:t><w:tab/><w:t>x</w:t><w:br/><w:t>y</w:t></w:r></w:p>"
+            "<w:p><w:r><mc:AlternateContent><mc:Choice><w:t>box</w:t></mc:Choice>"
+            f"<mc:Fallback>{para('box')}<w:t>box</w:t></mc:Fallback></mc:AlternateContent></w:r></w:p>")
+    assert docx_text(tmp_path, body).split("\n") == ["Hello\tx", "y", "box"]
+
+def test_docx_text_box_does_not_break_enclosing_paragraph(tmp_path):
+    body = ("<w:p><w:r><w:t xml:space=\"preserve\">Before </w:t></w:r>"
+            "<w:r><mc:AlternateContent><mc:Choice><w:drawing><w:txbxContent>"
+            f"{para('InBox')}"
+            "</w:txbxContent></w:drawing></mc:Choice></mc:AlternateContent></w:r>"
+            "<w:r><w:t>after</w:t></w:r></w:p>")
+    lines = docx_text(tmp_path, body).split("\n")
+    assert sorted(lines) == ["Before after", "InBox"]
+
+def test_docx_headers_and_footers_in_numeric_order(tmp_path):
+    parts = {f"word/header{i}.xml": f"<w:hdr {NS}>{para(f'H{i}')}</w:hdr>" for i in (10, 2, 1)}
+    parts["word/footer1.xml"] = f"<w:ftr {NS}>{para('F1')}</w:ftr>"
+    assert docx_text(tmp_path, para("Body"), parts).split("\n") == ["H1", "H2", "H10", "Body", "F1"]
+
+class _Discard(list):
+    def append(self, item):
+        pass
+
+def _parse_peak_bytes(path):
+    tracemalloc.start()
+    try:
+        with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as f:
+            StreamingDocxExtractor._parse_part(f, _Discard())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_docx_memory_flat_inside_one_large_table(tmp_path):
+    def big_table(rows):
+        return table(*([cell(para(f"cell {i} a")), cell(para(f"cell {i} b"))] for i in range(rows)))
+
+    small = _parse_peak_bytes(write_docx(tmp_path / "small.docx", big_table(5_000)))
+    large = _parse_peak_bytes(write_docx(tmp_path / "large.docx", big_table(40_000)))
+    # Eight times the rows must not mean noticeably more parser memory
+    assert large < small * 1.5 + 256 * 1024
+
+# --- HTML ---
+
+def html_text(tmp_path, data: bytes):
+    path = tmp_path / "page.html"
+    path.write_bytes(data)
+    return StreamingHtmlExtractor().extract(str(path))
+
+def test_html_matches_beautifulsoup_on_sample():
+    path = os.path.join(TESTS_DIR, "test_html.html")
+    assert StreamingHtmlExtractor().extract(path) == HtmlExtractor().extract(path)
+
+def test_html_skips_script_style_and_comments(tmp_path):
+    data = (b"<html><head><title>T</title><style>p{}</style><script>var x = '<p>';</script></head>"
+            b"<body><p>a &amp; b<!-- hidden --></p><template><p>t</p></template><p>c</p></body></html>")
+    assert html_text(tmp_path, data).split("\n") == ["T", "a & b", "c"]
+
+def test_html_text_node_spanning_chunks_stays_whole(tmp_path):
+    words = "word " * 30_000
+    text = html_text(tmp_path, f"<p>{words}</p><p>end</p>".encode())
+    assert text.split("\n") == [words.strip(), "end"]
+
+@pytest.mark.parametrize("head, expected", [
+    (codecs.BOM_UTF8 + b"<p>x</p>", ("utf-8-sig", True)),
+    (codecs.BOM_UTF16_LE + "<p>x</p>".encode("utf-16-le"), ("utf-16", True)),
+    (b'<?xml version="1.0" encoding="windows-1250"?><p>x</p>', ("cp1250", True)),
+    (b'<meta http-equiv="Content-Type" content="text/html; charset=koi8-r">', ("koi8-r", True)),
+    (b'<meta charset="ISO-8859-1">', ("cp1252", True)),
+    (b'<meta charset="us-ascii">', ("cp1252", True)),
+    (b'<meta charset="utf-16">', ("utf-8", True)),
+    (b"<p>caf\xc3\xa9</p>", ("utf-8", False)),
+    (b"<p>caf\xe9</p>", ("cp1252", False)),
+])
+def test_html_encoding_sniffing(head, expected):
+    assert _sniff_html_encoding(head) == expected
+
+def test_html_latin1_label_decodes_as_windows_1252(tmp_path):
+    data = b'<meta charset="iso-8859-1"><p>\x93quote\x94 \x80 caf\xe9</p>'
+    assert html_text(tmp_path, data) == "“quote” € café"
+
+def test_html_utf16_with_bom(tmp_path):
+    data = codecs.BOM_UTF16_LE + "<p>café</p>".encode("utf-16-le")
+    assert html_text(tmp_path, data) == "café"
+
+def test_html_undeclared_cp1252_after_ascii_first_chunk(tmp_path):
+    data = b"<p>ascii</p>" * 7000 + b"<p>caf\xe9</p>"
+    assert len(data) > StreamingHtmlExtractor.CHUNK_SIZE
+    assert html_text(tmp_path, data).split("\n")[-1] == "café"
+
+def test_html_undeclared_utf8_split_across_chunks(tmp_path):
+    # Pad so the two-byte e-acute straddles the first chunk boundary
+    pad = b"<p>" + b"a" * (StreamingHtmlExtractor.CHUNK_SIZE - 4) + b"</p>"
+    data = pad[:StreamingHtmlExtractor.CHUNK_SIZE - 1] + b"\xc3\xa9" + pad[StreamingHtmlExtractor.CHUNK_SIZE - 1:]
+    assert "é" in html_text(tmp_path, data)
@@ -0,0 +1,182 @@
+import random
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+ImageFont = pytest.importorskip("PIL.ImageFont")
+fitz = pytest.importorskip("fitz")
+
+from ocrapp.utils import PageFilter, image_dhash, is_blank_image
+
+# A4 at the 200 DPI used by pdf_to_images
+A4 = (1654, 2339)
+
+def render_page(lines=(), pt=10, background="white", ink="black", top=150):
+    img = Image.new("RGB", A4, background)
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=round(pt * 200 / 72))
+    for i, line in enumerate(lines):
+        draw.text((150, top + i * round(pt * 200 / 72 * 1.5)), line, fill=ink, font=font)
+    return img
+
+def statement(account, amount, pt):
+    body = [f"Line {i}: terms and conditions of the statement apply." for i in range(30)]
+    return render_page(body + [f"Account number: 1234 5678 {account} Amount: ${amount}"], pt=pt)
+
+# --- blank detection ---
+
+def test_truly_blank_page_is_blank():
+    assert is_blank_image(render_page())
+
+def test_speckled_blank_page_is_blank():
+    img = render_page()
+    draw = ImageDraw.Draw(img)
+    rng = random.Random(0)
+    for _ in range(15):
+        x, y = rng.randrange(A4[0]), rng.randrange(A4[1])
+        draw.rectangle((x, y, x + 1, y + 1), fill=(60, 60, 60))
+    # Light scanner noise close to the paper tone
+    for _ in range(20000):
+        img.putpixel((rng.randrange(A4[0]), rng.randrange(A4[1])), (225, 225, 225))
+    assert is_blank_image(img)
+
+@pytest.mark.parametrize("line, pt", [
+    ("Page 3", 10),
+    ("This is a single sentence set in seven point type.", 7),
+    ("Signed: ______ Date: ____", 10),
+])
+def test_single_short_line_is_content(line, pt):
+    assert not is_blank_image(render_page([line], pt=pt, top=1100))
+
+def test_light_text_on_dark_page_is_content():
+    page = render_page(["CONFIDENTIAL COVER PAGE"], pt=24, background=(20, 30, 90), ink="white", top=1100)
+    assert not is_blank_image(page)
+
+# --- duplicate detection ---
+
+def test_identical_pages_are_deduplicated():
+    page_filter = PageFilter()
+    key, cached = page_filter.lookup("engine", statement("9012", "100.00", 10))
+    assert cached is None
+    page_filter.store(key, "first page text")
+
+    _, cached = page_filter.lookup("engine", statement("9012", "100.00", 10))
+    assert cached == "first page text"
+
+@pytest.mark.parametrize("pt", [10, 12, 14])
+def test_pages_differing_by_one_digit_are_not_deduplicated(pt):
+    first = statement("9012", "100.00", pt)
+    second = statement("9013", "700.00", pt)
+    # The perceptual hash alone cannot tell these apart
+    assert image_dhash(first) == image_dhash(second)
+
+    page_filter = PageFilter()
+    key, _ = page_filter.lookup("engine", first)
+    page_filter.store(key, "account 9012")
+    _, cached = page_filter.lookup("engine", second)
+    assert cached is None
+
+def test_cover_letters_with_different_names_are_not_deduplicated():
+    letter = ["ACME Corporation", "12 Main Street", "", "{}", "", "Please find enclosed the documents."]
+    smith = render_page([l.format("Dear Mr. Smith,") for l in letter], pt=12)
+    jones = render_page([l.format("Dear Mr. Jones,") for l in letter], pt=12)
+
+    page_filter = PageFilter()
+    key, _ = page_filter.lookup("engine", smith)
+    page_filter.store(key, "smith")
+    assert page_filter.lookup("engine", jones)[1] is None
+
+def test_cache_is_namespaced_per_engine():
+    page = statement("9012", "100.00", 10)
+    page_filter = PageFilter()
+    key, _ = page_filter.lookup("pytesseract", page)
+    page_filter.store(key, "tesseract text")
+
+    assert page_filter.lookup("easyocr", page)[1] is None
+    assert page_filter.lookup("pytesseract", page)[1] == "tesseract text"
+
+def test_cache_is_bounded():
+    page_filter = PageFilter(cache_size=2)
+    pages = [render_page([f"Distinct page {i}"] * (i + 1), pt=20) for i in range(3)]
+    for i, page in enumerate(pages):
+        key, _ = page_filter.lookup("engine", page)
+        page_filter.store(key, str(i))
+
+    assert page_filter.lookup("engine", pages[0])[1] is None
+    assert page_filter.lookup("engine", pages[2])[1] == "2"
+
+# --- orchestrator integration ---
+
+orchestrator = pytest.importorskip("ocrapp.core.orchestrator")
+from ocrapp.core.scheduler import ResourceGovernor
+from ocrapp.extractors.ocr_extractors import BaseOCRExtractor
+from ocrapp.extractors.pdf_extractors import PyMuPDFExtractor
+from ocrapp.scoring.scorer import TextScorer
+
+class CountingOCRExtractor(BaseOCRExtractor):
+    """OCR engine stand-in that records how many pages it was asked to read."""
+    name = "counting-ocr"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def _read_page(self, img):
+        self.calls += 1
+        return f"Scanned page text number {self.calls} for the statement."
+
+    def extract(self, file_path):
+        return "\n".join(self._ocr_pages(self._load_images(file_path), self._read_page))
+
+def make_orchestrator(engine):
+    # Skip __init__, which loads the docling/easyocr models
+    extractor = orchestrator.DocumentExtractor.__new__(orchestrator.DocumentExtractor)
+    extractor.scorer = TextScorer()
+    extractor.governor = ResourceGovernor(cpu_budget=2, memory_budget_mb=1024)
+    pymupdf = PyMuPDFExtractor()
+    for attr in ("docling", "pdfplumber", "pymupdf", "easyocr", "docx", "html", "docx_stream", "html_stream"):
+        setattr(extractor, attr, pymupdf)
+    extractor.pytesseract = engine
+    return extractor
+
+@pytest.fixture
+def scanned_batch_pdf(tmp_path):
+    path = tmp_path / "batch.pdf"
+    with fitz.open() as doc:
+        for text in ("Cover letter for the batch", "Cover letter for the batch", None):
+            page = doc.new_page()
+            if text:
+                page.insert_text((72, 72), text, fontsize=12)
+        doc.save(str(path))
+    return str(path)
+
+def test_skip_counts_reach_debug_info(scanned_batch_pdf):
+    engine = CountingOCRExtractor()
+    result = make_orchestrator(engine).process(scanned_batch_pdf, extractor_name="counting-ocr")
+
+    debug = result["debug"][0]
+    assert debug["pages"] == 3
+    assert debug["skipped_blank_pages"] == 1
+    assert debug["skipped_duplicate_pages"] == 1
+    assert engine.calls == 1
+
+def test_document_cache_does_not_leak_between_process_calls(scanned_batch_pdf):
+    engine = CountingOCRExtractor()
+    extractor = make_orchestrator(engine)
+    extractor.process(scanned_batch_pdf, extractor_name="counting-ocr")
+    result = extractor.process(scanned_batch_pdf, extractor_name="counting-ocr")
+
+    assert result["debug"][0]["skipped_duplicate_pages"] == 1
+    assert engine.calls == 2
+    assert engine.page_filter is None
+
+def test_shared_page_filter_spans_a_batch(scanned_batch_pdf):
+    engine = CountingOCRExtractor()
+    extractor = make_orchestrator(engine)
+    batch = PageFilter()
+    extractor.process(scanned_batch_pdf, extractor_name="counting-ocr", page_filter=batch)
+    result = extractor.process(scanned_batch_pdf, extractor_name="counting-ocr", page_filter=batch)
+
+    assert result["debug"][0]["skipped_duplicate_pages"] == 2
+    assert engine.calls == 1
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from ocrapp.core.scheduler import EngineCost, ResourceGovernor
+
+COSTS = {
+    "heavy": EngineCost(threads=2, base_rss_mb=100, rss_per_page_mb=0),
+    "light": EngineCost(threads=1, base_rss_mb=10, rss_per_page_mb=0),
+}
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        time.sleep(0.005)
+
+def test_peak_threads_and_memory_stay_within_budget():
+    governor = ResourceGovernor(cpu_budget=4, memory_budget_mb=250, engine_costs=COSTS)
+    peak = {"threads": 0, "memory": 0.0}
+    lock = threading.Lock()
+
+    def job(engine):
+        with governor.admit(engine):
+            metrics = governor.metrics()
+            with lock:
+                peak["threads"] = max(peak["threads"], metrics["threads_in_use"])
+                peak["memory"] = max(peak["memory"], metrics["memory_in_use_mb"])
+            time.sleep(0.02)
+
+    workers = [threading.Thread(target=job, args=(engine,)) for engine in ["heavy", "light"] * 8]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert 0 < peak["threads"] <= 4
+    assert peak["memory"] <= 250
+    metrics = governor.metrics()
+    assert metrics["admitted"] == 16
+    assert metrics["running"] == 0 and metrics["queue_depth"] == 0
+
+def test_oversized_call_runs_alone_when_idle():
+    governor = ResourceGovernor(cpu_budget=1, memory_budget_mb=50, engine_costs=COSTS)
+    with governor.admit("heavy") as grant:
+        assert grant.threads == 1
+        assert grant.memory_mb == 50
+
+def test_admission_is_fifo():
+    governor = ResourceGovernor(cpu_budget=1, memory_budget_mb=1000, engine_costs=COSTS)
+    order = []
+
+    def job(i):
+        with governor.admit("light"):
+            order.append(i)
+
+    workers = []
+    with governor.admit("light"):
+        for i in range(5):
+            worker = threading.Thread(target=job, args=(i,))
+            worker.start()
+            workers.append(worker)
+            wait_for(lambda: governor.metrics()["queue_depth"] == i + 1)
+    for worker in workers:
+        worker.join()
+
+    assert order == [0, 1, 2, 3, 4]
+    assert governor.metrics()["max_queue_depth"] == 5
+
+def test_exception_inside_grant_releases_resources():
+    governor = ResourceGovernor(cpu_budget=2, memory_budget_mb=1000, engine_costs=COSTS)
+    with pytest.raises(RuntimeError):
+        with governor.admit("heavy"):
+            raise RuntimeError("engine crashed")
+
+    metrics = governor.metrics()
+    assert metrics["running"] == 0
+    assert metrics["threads_in_use"] == 0
+    assert metrics["memory_in_use_mb"] == 0
+
+def test_exception_while_queued_removes_ticket(monkeypatch):
+    governor = ResourceGovernor(cpu_budget=1, memory_budget_mb=1000, engine_costs=COSTS)
+
+    def failing_wait(timeout=None):
+        raise KeyboardInterrupt
+
+    with governor.admit("light"):
+        monkeypatch.setattr(governor._cond, "wait", failing_wait)
+        with pytest.raises(KeyboardInterrupt):
+            with governor.admit("light"):
+                pass
+        monkeypatch.undo()
+        assert governor.metrics()["queue_depth"] == 0
+
+    # Later admissions are not blocked by the abandoned ticket
+    with governor.admit("light"):
+        assert governor.metrics()["running"] == 1